@@ -12,5 +12,21 @@ cd deployment
 echo "Running SAM build..."
 sam build
 
+# Trim the built function packages to cut zip download and unzip time
+echo "Trimming build artifacts..."
+BUILD_DIR=".aws-sam/build"
+find "$BUILD_DIR" -type d -name __pycache__ -prune -exec rm -rf {} +
+find "$BUILD_DIR" -type d -name tests -prune -exec rm -rf {} +
+
+# googleapiclient bundles ~500 static discovery documents; only YouTube v3 is used
+find "$BUILD_DIR" -path '*/googleapiclient/discovery_cache/documents/*.json' \
+    ! -name 'youtube.v3.json' -delete
+
+if command -v strip >/dev/null 2>&1; then
+    find "$BUILD_DIR" -name '*.so' -exec strip --strip-unneeded {} + 2>/dev/null || true
+fi
+
+du -sh "$BUILD_DIR"/*/ 2>/dev/null || true
+
 echo "Build completed successfully!"
 echo "To deploy, run: ./scripts/deploy.sh"
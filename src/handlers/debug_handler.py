@@ -20,31 +20,27 @@ def lambda_handler(event, context):
         
         # Test 2: Environment variables
         api_key = os.getenv('YOUTUBE_API_KEY')
-        logger.info(f"Test 2: API key present: {'YES' if api_key else 'NO'}")
+        logger.info("Test 2: API key present: %s", 'YES' if api_key else 'NO')
         
         # Test 3: Import testing
         try:
             import urllib.parse
             logger.info("Test 3a: urllib.parse import - PASSED")
         except Exception as e:
-            logger.error(f"Test 3a: urllib.parse import - FAILED: {str(e)}")
+            logger.error("Test 3a: urllib.parse import - FAILED: %s", e)
         
         try:
             from googleapiclient.discovery import build
             logger.info("Test 3b: googleapiclient import - PASSED")
         except Exception as e:
-            logger.error(f"Test 3b: googleapiclient import - FAILED: {str(e)}")
+            logger.error("Test 3b: googleapiclient import - FAILED: %s", e)
         
-        try:
-            import isodate
-            logger.info("Test 3c: isodate import - PASSED")
-        except Exception as e:
-            logger.error(f"Test 3c: isodate import - FAILED: {str(e)}")
-        
-        # Test 4: Path and imports
-        logger.info(f"Python path: {sys.path}")
-        logger.info(f"Current directory: {os.getcwd()}")
-        logger.info(f"Directory contents: {os.listdir('.')}")
+        # Test 4: Path and imports; the path and directory dumps are DEBUG-only,
+        # so the listdir call is skipped at the module's INFO level
+        logger.info("Current directory: %s", os.getcwd())
+        logger.debug("Python path: %s", sys.path)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Directory contents: %s", os.listdir('.'))
         
         # Test 5: Try importing our services
         try:
@@ -52,13 +48,13 @@ def lambda_handler(event, context):
             from services.youtube_service import YouTubeService
             logger.info("Test 5a: YouTubeService import - PASSED")
         except Exception as e:
-            logger.error(f"Test 5a: YouTubeService import - FAILED: {str(e)}")
+            logger.error("Test 5a: YouTubeService import - FAILED: %s", e)
         
         try:
             from services.topic_service import TopicService
             logger.info("Test 5b: TopicService import - PASSED")
         except Exception as e:
-            logger.error(f"Test 5b: TopicService import - FAILED: {str(e)}")
+            logger.error("Test 5b: TopicService import - FAILED: %s", e)
         
         return {
             'statusCode': 200,
@@ -70,7 +66,7 @@ def lambda_handler(event, context):
         }
         
     except Exception as e:
-        logger.error(f"Debug handler error: {str(e)}", exc_info=True)
+        logger.error("Debug handler error: %s", e, exc_info=True)
         return {
             'statusCode': 500,
             'body': json.dumps({
@@ -1,74 +1,110 @@
 """
 AWS Lambda handler with real transcription integration.
 """
-import json
+import hashlib
 import logging
-import sys
-import os
+import threading
+from concurrent.futures import Future
+from typing import Dict, Tuple
+
+from cachetools import TTLCache
+
+from utils.json_utils import JSONDecodeError, dumps, loads
 
 # Configure logging first
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Services are built once per container during cold start and reused by warm
+# invocations. A failure is kept so every request reports it without retrying.
+try:
+    from services.youtube_service import YouTubeService
+    from services.topic_service import TopicService
+    from services.transcription_service import TranscriptionService
+    
+    _youtube_service = YouTubeService()
+    _topic_service = TopicService()
+    _transcription_service = TranscriptionService()
+    _init_error = None
+    logger.info("Successfully initialized all services")
+except Exception as e:
+    logger.error("Failed to initialize services: %s", e, exc_info=True)
+    _youtube_service = _topic_service = _transcription_service = None
+    _init_error = e
+
+# Upper bounds on the transcript echoed back in the response body
+MAX_SEGMENTS = 200
+MAX_TEXT_CHARS = 20000
+
+# Transcriptions in progress, so identical concurrent requests share one run
+_inflight_transcriptions: Dict[Tuple[str, int], Future] = {}
+_inflight_lock = threading.Lock()
+
+# ETags of recent responses keyed by request parameters, so conditional
+# requests within the cache lifetime can be answered without any work
+RESPONSE_MAX_AGE_SECONDS = 300
+_response_etags = TTLCache(maxsize=512, ttl=RESPONSE_MAX_AGE_SECONDS)
+
+
 def lambda_handler(event, context):
     """
     AWS Lambda handler for processing YouTube video analysis with real transcription.
     """
-    logger.info(f"Processing request: {event}")
+    logger.info("Processing request: %s %s", event.get('httpMethod'), event.get('path'))
+    logger.debug("Request event: %s", event)
+    
+    # Scheduled warm-up pings keep the container (and its services) hot
+    if event.get('warmer') or event.get('source') == 'aws.events':
+        return {'statusCode': 200, 'body': '{"warmed":true}'}
+    
+    if _init_error is not None:
+        return _error_response(500, f"Service initialization error: {str(_init_error)}")
     
     try:
-        # Add src to path for imports
-        current_dir = os.path.dirname(__file__)
-        parent_dir = os.path.join(current_dir, '..')
-        if parent_dir not in sys.path:
-            sys.path.append(parent_dir)
-        
         # Parse request body
-        body = _parse_request_body(event)
+        try:
+            body = _parse_request_body(event)
+        except ValueError:
+            return _bad_json_response()
         
         # Validate required parameters
         youtube_url = body.get('youtube_url')
         if not youtube_url:
-            return _error_response(400, 'Missing required parameter: youtube_url')
+            return _missing_url_response()
         
         topic = body.get('topic', 'bitcoin')
         duration_limit = min(int(body.get('duration_limit', 60)), 120)  # Max 2 minutes for demo
+        # JSON booleans only; bool("false") would be True and would split the ETag key
+        merge_clips = body.get('merge_clips', False)
+        if not isinstance(merge_clips, bool):
+            return _error_response(400, 'merge_clips must be a boolean')
         
-        # Import services
-        try:
-            from services.youtube_service import YouTubeService
-            from services.topic_service import TopicService
-            from services.transcription_service import TranscriptionService
-            logger.info("Successfully imported all services")
-        except ImportError as e:
-            logger.error(f"Failed to import services: {str(e)}")
-            return _error_response(500, f"Service import error: {str(e)}")
+        video_id = _youtube_service.extract_video_id(youtube_url)
         
-        # Initialize services
-        youtube_service = YouTubeService()
-        topic_service = TopicService()
-        transcription_service = TranscriptionService()
+        request_key = (video_id, topic, duration_limit, merge_clips)
+        if_none_match = _get_header(event, 'If-None-Match')
+        if if_none_match and _response_etags.get(request_key) == if_none_match:
+            return _not_modified_response(if_none_match)
         
-        # Get video metadata
-        video_id = youtube_service.extract_video_id(youtube_url)
-        video_info = youtube_service.get_video_info(video_id)
+        # Get video metadata first: the segment transcribed, the transcript
+        # cache key and the reported duration_processed all use its length, so
+        # a request yields the same span whether or not metadata was cached
+        video_info = _youtube_service.get_video_info(video_id)
         
         # Check if video is too long
         if video_info["duration_seconds"] > duration_limit:
-            logger.info(f"Video is {video_info['duration_seconds']}s, processing first {duration_limit}s only")
+            logger.info("Video is %ss, processing first %ss only", video_info['duration_seconds'], duration_limit)
         
-        # Get transcript (real or demo)
         processing_duration = min(video_info["duration_seconds"], duration_limit)
-        transcript = transcription_service.transcribe_video_segment(
-            video_id, 
-            start_time=0, 
-            duration=processing_duration
-        )
+        
+        # Get transcript (real or demo)
+        transcript = _coalesced_transcription(video_id, processing_duration)
         
         # Analyze transcript for topic mentions
-        mentions = topic_service.find_topic_mentions(transcript, topic)
-        clips = topic_service.generate_clip_timestamps(mentions)
-        transcript_summary = topic_service.get_transcript_summary(transcript)
+        # Both return iterators of records; the response needs the full lists
+        mentions = list(_topic_service.find_topic_mentions(transcript, topic))
+        clips = list(_topic_service.generate_clip_timestamps(mentions, merge_overlapping=merge_clips))
+        transcript_summary = _topic_service.get_transcript_summary(transcript)
         
         # Build comprehensive response
         response_data = {
@@ -83,13 +119,10 @@ def lambda_handler(event, context):
             'topic_analysis': {
                 'searched_topic': topic,
                 'mentions_found': len(mentions),
-                'mentions': mentions,
-                'suggested_clips': clips
-            },
-            'full_transcript': {
-                'segments': transcript.get('segments', []),
-                'full_text': transcript.get('text', '')
+                'mentions': [mention.to_dict() for mention in mentions],
+                'suggested_clips': [clip.to_dict() for clip in clips]
             },
+            'full_transcript': _bounded_transcript(transcript),
             'api_info': {
                 'youtube_api_used': video_info.get('api_source') == 'youtube_data_api_v3',
                 'transcription_source': transcript.get('source', 'unknown'),
@@ -103,31 +136,102 @@ def lambda_handler(event, context):
             ]
         }
         
-        return _success_response(response_data)
+        response = _success_response(response_data)
+        _response_etags[request_key] = response['headers']['ETag']
+        return response
         
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return _error_response(500, f'Internal server error: {str(e)}')
 
 
+def _coalesced_transcription(video_id, duration):
+    """Transcribe from the start of the video, joining an identical transcription already running."""
+    key = (video_id, duration)
+    with _inflight_lock:
+        future = _inflight_transcriptions.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _inflight_transcriptions[key] = future
+    
+    if not is_owner:
+        logger.info("Joining in-flight transcription for %s", video_id)
+        return future.result()
+    
+    try:
+        transcript = _transcription_service.transcribe_video_segment(
+            video_id, 
+            start_time=0, 
+            duration=duration
+        )
+        future.set_result(transcript)
+        return transcript
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight_transcriptions.pop(key, None)
+
+
+def _bounded_transcript(transcript):
+    """Build the full_transcript payload, truncated to the response limits."""
+    segments = transcript.get('segments', [])
+    full_text = transcript.get('text', '')
+    
+    return {
+        'segments': segments[:MAX_SEGMENTS],
+        'full_text': full_text[:MAX_TEXT_CHARS],
+        'truncated': len(segments) > MAX_SEGMENTS or len(full_text) > MAX_TEXT_CHARS
+    }
+
+
 def _parse_request_body(event):
     """Parse and validate request body."""
-    body_str = event.get('body', '{}')
+    body_str = event.get('body') or '{}'
     try:
-        return json.loads(body_str)
-    except json.JSONDecodeError:
+        return loads(body_str)
+    except JSONDecodeError:
         raise ValueError('Invalid JSON in request body')
 
 
+def _get_header(event, name):
+    """Look up a request header case-insensitively."""
+    headers = event.get('headers') or {}
+    name_lower = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name_lower:
+            return value
+    return None
+
+
 def _success_response(data):
-    """Create successful response."""
+    """Create successful response with a content ETag for caches in front of the API."""
+    body = dumps(data)
+    etag = '"' + hashlib.blake2b(body.encode('utf-8'), digest_size=8).hexdigest() + '"'
     return {
         'statusCode': 200,
         'headers': {
             'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*'
+            'Access-Control-Allow-Origin': '*',
+            'ETag': etag,
+            'Cache-Control': f'public, max-age={RESPONSE_MAX_AGE_SECONDS}'
         },
-        'body': json.dumps(data, indent=2)
+        'body': body
+    }
+
+
+def _not_modified_response(etag):
+    """Create a 304 response confirming the client's cached copy."""
+    return {
+        'statusCode': 304,
+        'headers': {
+            'Access-Control-Allow-Origin': '*',
+            'ETag': etag,
+            'Cache-Control': f'public, max-age={RESPONSE_MAX_AGE_SECONDS}'
+        },
+        'body': ''
     }
 
 
@@ -139,8 +243,21 @@ def _error_response(status_code, message):
             'Content-Type': 'application/json',
             'Access-Control-Allow-Origin': '*'
         },
-        'body': json.dumps({
+        'body': dumps({
             'status': 'error',
             'message': message
         })
     }
+
+
+def _prebuilt_error_response(status_code, message):
+    """Serialize an error response once; each call returns a copy with its own headers."""
+    response = _error_response(status_code, message)
+    # Callers may mutate what they get back (e.g. add headers), so the shared
+    # dicts are never handed out; only the immutable body string is reused
+    return lambda: {**response, 'headers': dict(response['headers'])}
+
+
+# Prebuilt responses for the most common client errors (e.g. bots probing the endpoint)
+_missing_url_response = _prebuilt_error_response(400, 'Missing required parameter: youtube_url')
+_bad_json_response = _prebuilt_error_response(400, 'Invalid JSON in request body')
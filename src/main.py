@@ -1,8 +1,4 @@
 import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
 
 def test_environment():
     """Test that the environment is set up correctly."""
@@ -23,5 +19,9 @@ def test_environment():
         print(f"Package import error: {e}")
 
 if __name__ == "__main__":
+    # Load environment variables from .env for local runs only; Lambda injects them
+    from dotenv import load_dotenv
+    load_dotenv()
+    
     print("YouTube AI Clipper - Environment Setup")
     test_environment()
\ No newline at end of file
@@ -1,15 +1,147 @@
 """
-yt-dlp only audio processing service (no external ffmpeg dependency).
+yt-dlp audio processing service; segment extraction and mp3 conversion need ffmpeg on PATH.
 """
+import asyncio
+import fnmatch
+import functools
 import logging
 import os
 import tempfile
 import subprocess
+import sys
+import threading
+import time
 import json
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional
+
+from cachetools import TTLCache
+
+from utils.disk_cache import get_cache
+
+try:
+    from yt_dlp import YoutubeDL
+    from yt_dlp.utils import DownloadCancelled, download_range_func
+    # Subprocess work runs the installed package, so no separate binary is needed
+    YT_DLP_CMD = [sys.executable, '-m', 'yt_dlp']
+except ImportError:  # fall back to the yt-dlp binary on PATH (Lambda layer)
+    YoutubeDL = None
+    YT_DLP_CMD = ['yt-dlp']
 
 logger = logging.getLogger(__name__)
 
+# Video metadata rarely changes, so a day-old disk entry is still good
+VIDEO_INFO_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# In-memory metadata from downloads is bounded so warm containers don't grow it forever
+INFO_MEMORY_CACHE_SIZE = 1024
+INFO_MEMORY_CACHE_TTL_SECONDS = 3600
+
+# Audio-only formats in the containers YouTube serves, then any audio, then best.
+# Naming them up front spares yt-dlp ranking and probing every format.
+AUDIO_FORMAT = 'ba[ext=m4a]/ba[ext=webm]/ba/b'
+
+# yt-dlp caches deciphered player signatures here; the temp dir is the only
+# writable path on Lambda and outlives invocations in a warm container
+YT_DLP_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'yt-dlp-cache')
+
+# One in-process extractor per container; YoutubeDL is not safe for concurrent use
+_ydl = None
+_ydl_lock = threading.Lock()
+
+# Batch downloads run on up to 8 threads, but at most 4 segment downloads talk
+# to YouTube at once across the process; more from one IP draw HTTP 429s
+MAX_BATCH_WORKERS = 8
+_youtube_slots = threading.BoundedSemaphore(4)
+PERMIT_POLL_SECONDS = 0.1  # async downloads wait for a permit without a thread
+
+# Wall-clock bound on one in-process segment download, as the subprocess path
+# has; socket_timeout only bounds each read, not a slow-drip stream
+DOWNLOAD_TIMEOUT_SECONDS = 120
+_download_executor = ThreadPoolExecutor(max_workers=MAX_BATCH_WORKERS)
+
+
+def _extract_info(youtube_url: str) -> Dict[str, Any]:
+    """Resolve metadata and the selected audio format in-process, without downloading."""
+    global _ydl
+    with _ydl_lock:
+        if _ydl is None:
+            _ydl = YoutubeDL({
+                'quiet': True,
+                'no_warnings': True,
+                'cachedir': YT_DLP_CACHE_DIR,
+                'format': AUDIO_FORMAT,
+                'skip_download': True
+            })
+        return _ydl.extract_info(youtube_url, download=False)
+
+
+def _download_section(youtube_url: str, output_file: str, start_time: int, duration: int) -> Dict[str, Any]:
+    """
+    Download one time range as 16 kHz mono mp3 in-process and return its info dict.
+    
+    Takes a _youtube_slots permit, so the caller must not hold one.
+    
+    Raises:
+        FutureTimeoutError: If the download takes longer than DOWNLOAD_TIMEOUT_SECONDS
+    """
+    _youtube_slots.acquire()
+    try:
+        deadline = time.monotonic() + DOWNLOAD_TIMEOUT_SECONDS
+        future = _download_executor.submit(_run_section_download, youtube_url, output_file, start_time, duration, deadline)
+    except BaseException:
+        _youtube_slots.release()
+        raise
+    
+    # The permit returns when the worker exits, not when the caller stops waiting:
+    # a timed-out download keeps running (ffmpeg rarely reports progress), and it
+    # must still count against the per-IP limit. With at most 4 workers holding
+    # permits, the 8-thread executor never queues behind stuck downloads.
+    future.add_done_callback(lambda _: _youtube_slots.release())
+    return future.result(timeout=DOWNLOAD_TIMEOUT_SECONDS)
+
+
+def _run_section_download(youtube_url: str, output_file: str, start_time: int, duration: int, deadline: float) -> Dict[str, Any]:
+    """Run the yt-dlp download for _download_section on a worker thread."""
+    def check_deadline(progress: Dict[str, Any]):
+        # A download the caller gave up on stops at its next progress report
+        # instead of holding the worker and the connection
+        if time.monotonic() > deadline:
+            raise DownloadCancelled(f"Download exceeded {DOWNLOAD_TIMEOUT_SECONDS}s")
+    
+    # Output template, range and postprocessors are fixed at construction, so each
+    # download gets its own instance instead of mutating the shared extractor
+    with YoutubeDL({
+        'quiet': True,
+        'no_warnings': True,
+        'cachedir': YT_DLP_CACHE_DIR,
+        'format': AUDIO_FORMAT,
+        'check_formats': False,
+        'socket_timeout': 30,
+        'outtmpl': output_file,
+        'download_ranges': download_range_func(None, [(start_time, start_time + duration)]),
+        'force_keyframes_at_cuts': True,
+        'progress_hooks': [check_deadline],
+        'postprocessors': [{
+            'key': 'FFmpegExtractAudio',
+            'preferredcodec': 'mp3',
+            'preferredquality': '32'
+        }],
+        'postprocessor_args': {'ffmpeg': ['-ar', '16000', '-ac', '1']}
+    }) as ydl:
+        return ydl.extract_info(youtube_url)
+
+
+@functools.lru_cache(maxsize=None)
+def _tool_available(tool_name: str) -> bool:
+    """Check if a command line tool is available (probed once per process)."""
+    try:
+        result = subprocess.run([tool_name, '--version'], 
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
+        return result.returncode == 0
+    except Exception:
+        return False
+
 
 class AudioService:
     """Service for handling audio extraction using yt-dlp only."""
@@ -18,19 +150,26 @@ class AudioService:
         """Initialize the audio service."""
         self.temp_dir = tempfile.gettempdir()
         
-        # Check tool availability
-        self.yt_dlp_available = self._check_tool_availability('yt-dlp')
+        # Metadata captured as a by-product of downloads, keyed by video ID.
+        # get_video_info counts hits per tier; a miss means both tiers missed.
+        # Batch downloads fill it from worker threads, so the lock guards it.
+        self._info_cache = TTLCache(maxsize=INFO_MEMORY_CACHE_SIZE, ttl=INFO_MEMORY_CACHE_TTL_SECONDS)
+        self._info_cache_lock = threading.Lock()
+        self.memory_cache_hits = 0
+        self.disk_cache_hits = 0
+        self.cache_misses = 0
         
-        logger.info(f"Audio service initialized - yt-dlp: {self.yt_dlp_available}")
+        # Check tool availability (the importable package needs no probe)
+        self.yt_dlp_in_process = YoutubeDL is not None
+        self.yt_dlp_available = self.yt_dlp_in_process or self._check_tool_availability('yt-dlp')
+        # yt-dlp hands range downloads and audio extraction to ffmpeg (Lambda layer)
+        self.ffmpeg_available = self._check_tool_availability('ffmpeg')
+        
+        logger.info(f"Audio service initialized - yt-dlp: {self.yt_dlp_available} (in-process: {self.yt_dlp_in_process}), ffmpeg: {self.ffmpeg_available}")
     
     def _check_tool_availability(self, tool_name: str) -> bool:
         """Check if a command line tool is available."""
-        try:
-            result = subprocess.run([tool_name, '--version'], 
-                                  capture_output=True, text=True, timeout=10)
-            return result.returncode == 0
-        except Exception:
-            return False
+        return _tool_available(tool_name)
     
     def extract_audio_url(self, video_id: str) -> Optional[str]:
         """
@@ -45,12 +184,23 @@ class AudioService:
         try:
             youtube_url = f"https://www.youtube.com/watch?v={video_id}"
             
+            if self.yt_dlp_in_process:
+                logger.info(f"Getting audio URL for {video_id}")
+                audio_url = _extract_info(youtube_url).get('url')
+                if audio_url:
+                    logger.info(f"Successfully extracted audio URL for {video_id}")
+                else:
+                    logger.error(f"yt-dlp returned no URL for {video_id}")
+                return audio_url
+            
             # Use yt-dlp to get the best audio stream URL
             cmd = [
-                'yt-dlp',
+                *YT_DLP_CMD,
+                '--cache-dir', YT_DLP_CACHE_DIR,
                 '--quiet',
                 '--no-warnings',
-                '--format', 'bestaudio/best',  # Prefer audio-only, fallback to best quality
+                '--format', AUDIO_FORMAT,  # Prefer audio-only, fallback to best quality
+                '--no-check-formats',
                 '--get-url',
                 youtube_url
             ]
@@ -78,60 +228,48 @@ class AudioService:
         Download audio segment using yt-dlp's built-in processing.
         
         yt-dlp has built-in audio processing capabilities that can:
-        - Extract segments 
+        - Download only the requested time range (--download-sections)
         - Convert formats
         - Adjust quality
-        - All without external ffmpeg dependency
         """
         if not self.yt_dlp_available:
             logger.error("yt-dlp not available")
             return None
         
+        # Every download in the process holds a _youtube_slots permit while it
+        # talks to YouTube; _download_section takes its own
         try:
             youtube_url = f"https://www.youtube.com/watch?v={video_id}"
             output_file = os.path.join(self.temp_dir, f"{video_id}_{start_time}_{duration}.%(ext)s")
             
-            # Use yt-dlp with built-in post-processing
-            cmd = [
-                'yt-dlp',
-                '--quiet',                          # Minimal output
-                '--no-warnings',
-                '--format', 'bestaudio/best',       # Get best audio quality available
-                
-                # Download section (segment)
-                '--external-downloader-args', f'ffmpeg:-ss {start_time} -t {duration}',
-                
-                # Audio post-processing (built into yt-dlp)
-                '--extract-audio',                  # Convert to audio-only
-                '--audio-format', 'mp3',            # Output format
-                '--audio-quality', '64K',           # Low bitrate for faster processing
-                
-                # Output file
-                '--output', output_file,
-                
-                youtube_url
-            ]
-            
             logger.info(f"Starting yt-dlp download for segment {start_time}s-{start_time+duration}s")
             
-            # Execute with timeout
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            if self.yt_dlp_in_process:
+                try:
+                    info = _download_section(youtube_url, output_file, start_time, duration)
+                    self._remember_video_info(video_id, info)
+                    return self._locate_segment_file(output_file, video_id, start_time, duration)
+                except FutureTimeoutError:
+                    logger.error("yt-dlp timeout - video segment might be too long or network slow")
+                    return None
+                except Exception as e:
+                    logger.warning(f"In-process download failed, trying fallback: {str(e)}")
+                    with _youtube_slots:
+                        return self._download_fallback_method(youtube_url, video_id, start_time, duration)
             
-            if result.returncode == 0:
-                # Find the actual output file (yt-dlp might change extension)
-                actual_file = self._find_output_file(output_file, video_id, start_time, duration)
+            # Execute with timeout
+            cmd = self._build_segment_cmd(youtube_url, output_file, start_time, duration)
+            with _youtube_slots:
+                # Only stderr is reported; --quiet leaves stdout empty anyway
+                result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=120)
                 
-                if actual_file and os.path.exists(actual_file):
-                    file_size_mb = os.path.getsize(actual_file) / (1024 * 1024)
-                    logger.info(f"yt-dlp download successful: {actual_file} ({file_size_mb:.2f}MB)")
-                    return actual_file
+                if result.returncode == 0:
+                    self._read_info_sidecar(output_file, video_id)
+                    return self._locate_segment_file(output_file, video_id, start_time, duration)
                 else:
-                    logger.error("yt-dlp completed but output file not found")
-                    return None
-            else:
-                # Try fallback method if the first approach fails
-                logger.warning(f"First method failed, trying fallback: {result.stderr}")
-                return self._download_fallback_method(youtube_url, video_id, start_time, duration)
+                    # Try fallback method if the first approach fails
+                    logger.warning(f"First method failed, trying fallback: {result.stderr}")
+                    return self._download_fallback_method(youtube_url, video_id, start_time, duration)
                 
         except subprocess.TimeoutExpired:
             logger.error("yt-dlp timeout - video segment might be too long or network slow")
@@ -140,64 +278,198 @@ class AudioService:
             logger.error(f"yt-dlp download exception: {str(e)}")
             return None
     
+    def download_audio_segments_batch(self, video_ids: List[str], start_time: int = 0, duration: int = 60) -> List[Optional[str]]:
+        """
+        Download the same time range from several videos concurrently.
+        
+        Args:
+            video_ids: YouTube video IDs
+            start_time: Segment start in seconds
+            duration: Segment length in seconds
+            
+        Returns:
+            Downloaded file paths in input order, None where a download failed
+        """
+        if not video_ids:
+            return []
+        
+        # download_audio_segment takes a _youtube_slots permit per download
+        with ThreadPoolExecutor(max_workers=min(MAX_BATCH_WORKERS, len(video_ids))) as executor:
+            return list(executor.map(
+                lambda video_id: self.download_audio_segment(video_id, start_time, duration), video_ids
+            ))
+    
+    async def download_audio_segment_async(self, video_id: str, start_time: int = 0, duration: int = 60) -> Optional[str]:
+        """
+        Async variant of download_audio_segment.
+        
+        yt-dlp runs under asyncio so callers can await the download alongside
+        other I/O instead of blocking a thread for its full duration.
+        """
+        if not self.yt_dlp_available:
+            logger.error("yt-dlp not available")
+            return None
+        
+        try:
+            youtube_url = f"https://www.youtube.com/watch?v={video_id}"
+            output_file = os.path.join(self.temp_dir, f"{video_id}_{start_time}_{duration}.%(ext)s")
+            cmd = self._build_segment_cmd(youtube_url, output_file, start_time, duration)
+            
+            logger.info(f"Starting async yt-dlp download for segment {start_time}s-{start_time+duration}s")
+            
+            # Same per-IP budget as the threaded paths. The permit is polled rather
+            # than awaited on a thread: blocked waiters would otherwise fill the
+            # default executor that permit holders need for their fallback.
+            while not _youtube_slots.acquire(blocking=False):
+                await asyncio.sleep(PERMIT_POLL_SECONDS)
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+                )
+                try:
+                    _, stderr = await asyncio.wait_for(proc.communicate(), timeout=120)
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+                    logger.error("yt-dlp timeout - video segment might be too long or network slow")
+                    return None
+                
+                if proc.returncode == 0:
+                    self._read_info_sidecar(output_file, video_id)
+                    return self._locate_segment_file(output_file, video_id, start_time, duration)
+                else:
+                    logger.warning(f"First method failed, trying fallback: {stderr.decode(errors='replace')}")
+                    return await asyncio.to_thread(
+                        self._download_fallback_method, youtube_url, video_id, start_time, duration
+                    )
+            finally:
+                _youtube_slots.release()
+            
+        except Exception as e:
+            logger.error(f"yt-dlp download exception: {str(e)}")
+            return None
+    
+    def _build_segment_cmd(self, youtube_url: str, output_file: str, start_time: int, duration: int) -> List[str]:
+        """Build the yt-dlp command that downloads and converts one audio segment."""
+        # Use yt-dlp with built-in post-processing
+        return [
+            *YT_DLP_CMD,
+            '--cache-dir', YT_DLP_CACHE_DIR,    # Reuse cached player signatures
+            '--quiet',                          # Minimal output
+            '--no-warnings',
+            '--format', AUDIO_FORMAT,           # Get best audio quality available
+            '--no-check-formats',
+            
+            # Download section (segment) - only this time range is fetched
+            '--download-sections', f'*{start_time}-{start_time + duration}',
+            '--force-keyframes-at-cuts',
+            
+            # Audio post-processing (built into yt-dlp)
+            '--extract-audio',                  # Convert to audio-only
+            '--audio-format', 'mp3',            # Output format
+            '--audio-quality', '32K',           # Speech needs no more at 16 kHz mono
+            '--postprocessor-args', 'ffmpeg:-ar 16000 -ac 1',  # 16 kHz mono is all ASR needs
+            
+            # Metadata sidecar, so get_video_info needs no second request
+            '--write-info-json',
+            
+            # Output file
+            '--output', output_file,
+            
+            youtube_url
+        ]
+    
+    def _remember_video_info(self, video_id: str, info: Dict[str, Any]):
+        """Keep the summary of a download's info dict for get_video_info."""
+        summary = self._summarize_video_info(info)
+        with self._info_cache_lock:
+            self._info_cache[video_id] = summary
+    
+    def _read_info_sidecar(self, output_file: str, video_id: str):
+        """Cache the metadata from a download's .info.json sidecar, then remove it."""
+        info_file = output_file.replace('.%(ext)s', '.info.json')
+        try:
+            with open(info_file, 'r', encoding='utf-8') as f:
+                self._remember_video_info(video_id, json.load(f))
+            os.remove(info_file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read info sidecar {info_file}: {str(e)}")
+    
+    def _locate_segment_file(self, output_file: str, video_id: str, start_time: int, duration: int) -> Optional[str]:
+        """Return the file a successful segment download produced, if it exists."""
+        # Find the actual output file (yt-dlp might change extension)
+        actual_file = self._find_output_file(output_file, video_id, start_time, duration)
+        
+        if actual_file and os.path.exists(actual_file):
+            file_size_mb = os.path.getsize(actual_file) / (1024 * 1024)
+            logger.info(f"yt-dlp download successful: {actual_file} ({file_size_mb:.2f}MB)")
+            return actual_file
+        else:
+            logger.error("yt-dlp completed but output file not found")
+            return None
+    
     def _find_output_file(self, pattern_file: str, video_id: str, start_time: int, duration: int) -> Optional[str]:
         """Find the actual output file created by yt-dlp."""
         # Common extensions yt-dlp might use
         possible_extensions = ['.mp3', '.m4a', '.webm', '.opus']
         base_pattern = pattern_file.replace('.%(ext)s', '')
+        base_name = os.path.basename(base_pattern)
+        
+        # One directory read answers every candidate check below
+        search_dir = os.path.dirname(base_pattern) or self.temp_dir
+        with os.scandir(search_dir) as entries:
+            names = [entry.name for entry in entries]
+        name_set = set(names)
         
         for ext in possible_extensions:
-            test_file = f"{base_pattern}{ext}"
-            if os.path.exists(test_file):
-                return test_file
+            if f"{base_name}{ext}" in name_set:
+                return f"{base_pattern}{ext}"
         
         # Also check for files with video title in name
-        import glob
-        temp_pattern = os.path.join(self.temp_dir, f"*{video_id}*{start_time}*{duration}*.mp3")
-        matches = glob.glob(temp_pattern)
+        matches = fnmatch.filter(names, f"*{video_id}*{start_time}*{duration}*.mp3")
         if matches:
-            return matches[0]
+            return os.path.join(search_dir, matches[0])
         
         return None
     
     def _download_fallback_method(self, youtube_url: str, video_id: str, start_time: int, duration: int) -> Optional[str]:
         """
-        Fallback method: Download full audio, then extract segment.
+        Fallback method: let ffmpeg seek into the audio stream and fetch only the segment.
         
-        This is less efficient but more reliable when segment extraction fails.
+        This skips --download-sections and keyframe cutting, the usual points of
+        failure, while still transferring roughly the requested range.
         """
         try:
-            logger.info("Trying fallback method: download full audio then extract segment")
+            logger.info("Trying fallback method: ffmpeg seek download of the segment")
             
-            # Download full audio first
-            temp_audio = os.path.join(self.temp_dir, f"{video_id}_full.%(ext)s")
+            temp_audio = os.path.join(self.temp_dir, f"{video_id}_{start_time}_{duration}_fallback.%(ext)s")
             
             cmd1 = [
-                'yt-dlp',
+                *YT_DLP_CMD,
+                '--cache-dir', YT_DLP_CACHE_DIR,
                 '--quiet',
                 '--no-warnings',
-                '--format', 'bestaudio',
+                '--format', AUDIO_FORMAT,
+                '--no-check-formats',
+                # Input-side seek: ffmpeg issues range requests for just this window
+                '--downloader', 'ffmpeg',
+                '--downloader-args', f'ffmpeg_i:-ss {start_time} -t {duration}',
                 '--extract-audio',
                 '--audio-format', 'mp3',
-                '--audio-quality', '64K',
+                '--audio-quality', '32K',
+                '--postprocessor-args', 'ffmpeg:-ar 16000 -ac 1',
                 '--output', temp_audio,
                 youtube_url
             ]
             
-            result1 = subprocess.run(cmd1, capture_output=True, text=True, timeout=60)
+            result1 = subprocess.run(cmd1, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=60)
             
             if result1.returncode == 0:
-                # Find the downloaded file
-                full_audio_file = self._find_output_file(temp_audio, video_id, 0, 0)
+                segment_file = self._find_output_file(temp_audio, video_id, start_time, duration)
                 
-                if full_audio_file and os.path.exists(full_audio_file):
-                    logger.info(f"Full audio downloaded: {full_audio_file}")
-                    
-                    # Extract segment using yt-dlp's built-in capabilities
-                    # Note: This is a simplified approach since we don't have external ffmpeg
-                    # We'll return the full file for now and let AWS Transcribe handle the duration
-                    logger.warning(f"Fallback: returning full audio file (AWS Transcribe will process {start_time}s-{start_time+duration}s)")
-                    return full_audio_file
+                if segment_file and os.path.exists(segment_file):
+                    logger.info(f"Fallback segment downloaded: {segment_file}")
+                    return segment_file
                     
             logger.error("Fallback method also failed")
             return None
@@ -224,43 +496,96 @@ class AudioService:
         if not self.yt_dlp_available:
             return {"error": "yt-dlp not available"}
         
+        with self._info_cache_lock:
+            cached = self._info_cache.get(video_id)
+        if cached is not None:
+            self.memory_cache_hits += 1
+            return cached
+        
+        cache = get_cache()
+        cache_key = f"video_info:{video_id}"
+        if cache is not None:
+            # Disk cache failures (full /tmp, corrupt database) only cost a fetch
+            try:
+                cached = cache.get(cache_key)
+            except Exception as e:
+                logger.warning(f"Video info cache read failed for {video_id}: {str(e)}")
+                cached = None
+            if cached is not None:
+                self.disk_cache_hits += 1
+                return cached
+        self.cache_misses += 1
+        
+        video_info = self._fetch_video_info(video_id)
+        if cache is not None and "error" not in video_info:
+            try:
+                cache.set(cache_key, video_info, expire=VIDEO_INFO_CACHE_TTL_SECONDS)
+            except Exception as e:
+                logger.warning(f"Video info cache write failed for {video_id}: {str(e)}")
+        return video_info
+    
+    def _fetch_video_info(self, video_id: str) -> dict:
+        """Request video information from YouTube through yt-dlp."""
         try:
             youtube_url = f"https://www.youtube.com/watch?v={video_id}"
             
+            if self.yt_dlp_in_process:
+                return self._summarize_video_info(_extract_info(youtube_url))
+            
             cmd = [
-                'yt-dlp',
+                *YT_DLP_CMD,
+                '--cache-dir', YT_DLP_CACHE_DIR,
                 '--quiet',
                 '--no-warnings',
                 '--dump-json',  # Get metadata as JSON
                 youtube_url
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            # Parse the JSON straight off the pipe instead of buffering it as a
+            # str first; the timer enforces the same 30 s limit as run(timeout=)
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL) as proc:
+                timer = threading.Timer(30, proc.kill)
+                timer.start()
+                try:
+                    video_info = json.load(proc.stdout)
+                except ValueError:
+                    video_info = None
+                finally:
+                    timer.cancel()
+                returncode = proc.wait()
             
-            if result.returncode == 0:
-                video_info = json.loads(result.stdout)
-                return {
-                    "id": video_info.get("id"),
-                    "title": video_info.get("title"),
-                    "duration": video_info.get("duration"),
-                    "uploader": video_info.get("uploader"),
-                    "view_count": video_info.get("view_count"),
-                    "source": "yt-dlp"
-                }
+            if returncode == 0 and video_info:
+                return self._summarize_video_info(video_info)
             else:
-                logger.error(f"yt-dlp info extraction failed: {result.stderr}")
+                logger.error(f"yt-dlp info extraction failed with exit code {returncode}")
                 return {"error": "Failed to get video info"}
                 
         except Exception as e:
             logger.error(f"Video info extraction error: {str(e)}")
             return {"error": str(e)}
     
+    def _summarize_video_info(self, video_info: Dict[str, Any]) -> dict:
+        """Reduce yt-dlp's info dict to the fields this service reports."""
+        return {
+            "id": video_info.get("id"),
+            "title": video_info.get("title"),
+            "duration": video_info.get("duration"),
+            "uploader": video_info.get("uploader"),
+            "view_count": video_info.get("view_count"),
+            "source": "yt-dlp"
+        }
+    
     def get_service_status(self) -> dict:
         """Get status of audio service capabilities."""
         return {
             "yt_dlp_available": self.yt_dlp_available,
-            "ffmpeg_available": False,  # We're not using external ffmpeg
+            "yt_dlp_in_process": self.yt_dlp_in_process,
+            "ffmpeg_available": self.ffmpeg_available,
             "temp_dir": self.temp_dir,
             "service_ready": self.yt_dlp_available,
-            "processing_method": "yt-dlp built-in"
+            "processing_method": "yt-dlp built-in",
+            "cache_hits": self.memory_cache_hits + self.disk_cache_hits,
+            "memory_cache_hits": self.memory_cache_hits,
+            "disk_cache_hits": self.disk_cache_hits,
+            "cache_misses": self.cache_misses
         }
\ No newline at end of file
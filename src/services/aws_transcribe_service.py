@@ -1,17 +1,61 @@
 """
 AWS Transcribe service for real speech-to-text transcription.
 """
+import hashlib
 import logging
 import os
+import random
 import time
 import uuid
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+from utils.disk_cache import get_cache
+from utils.json_utils import loads
+
 logger = logging.getLogger(__name__)
 
+# Identical audio always transcribes the same, and every job is billed
+TRANSCRIPT_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Typical segments fit in one PUT; anything larger uploads as parallel 5 MiB
+# parts (the S3 minimum, so a lower threshold would only add round trips)
+UPLOAD_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=5 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True
+)
+
+# Concurrent jobs per batch; Transcribe's default quota is far higher, this
+# mainly bounds threads and S3 connections held by one invocation
+MAX_BATCH_WORKERS = 8
+
+# Job status polling: short segment jobs finish in seconds, so start fast and
+# back off geometrically to spare GetTranscriptionJob calls on long ones
+POLL_INITIAL_DELAY_SECONDS = 0.5
+POLL_MAX_DELAY_SECONDS = 10.0
+POLL_BACKOFF_FACTOR = 1.5
+POLL_JITTER = 0.2  # +/-20%, so concurrent batch jobs don't poll in lockstep
+
+# One session and client config for the process: batch workers, the upload
+# threads and cleanup all share pooled keep-alive connections, and adaptive
+# retries back off client-side when Transcribe or S3 throttle
+_session = boto3.session.Session()
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 5},
+    tcp_keepalive=True
+)
+
+# Job deletion runs here while the calling thread deletes the S3 objects
+_cleanup_executor = ThreadPoolExecutor(max_workers=MAX_BATCH_WORKERS)
+
 
 class AWSTranscribeService:
     """Service for transcribing audio using AWS Transcribe."""
@@ -30,8 +74,11 @@ class AWSTranscribeService:
             raise ValueError("TRANSCRIPTION_BUCKET environment variable not set")
         
         # Initialize AWS clients
-        self.s3_client = boto3.client('s3', region_name=self.region)
-        self.transcribe_client = boto3.client('transcribe', region_name=self.region)
+        self.s3_client = _session.client('s3', region_name=self.region, config=CLIENT_CONFIG)
+        self.transcribe_client = _session.client('transcribe', region_name=self.region, config=CLIENT_CONFIG)
+        
+        self.cache_hits = 0
+        self.cache_misses = 0
         
         logger.info(f"AWS Transcribe service initialized with bucket: {self.bucket_name}")
     
@@ -46,6 +93,55 @@ class AWSTranscribeService:
         Returns:
             Transcription result with segments and timestamps
         """
+        # The cache only saves work: read or write failures (a full or read-only
+        # /tmp, a corrupt database) fall through to a normal transcription
+        cache = get_cache()
+        cache_key = None
+        if cache is not None:
+            try:
+                cache_key = f"transcript:{self._file_digest(audio_file_path)}"
+                cached = cache.get(cache_key)
+            except Exception as e:
+                logger.warning(f"Transcript cache read failed for {video_id}: {str(e)}")
+                cached = None
+            if cached is not None:
+                self.cache_hits += 1
+                logger.info(f"Transcript cache hit for {video_id}")
+                return cached
+            self.cache_misses += 1
+        
+        transcript_data = self._transcribe_uncached(audio_file_path, video_id)
+        if cache_key is not None:
+            try:
+                cache.set(cache_key, transcript_data, expire=TRANSCRIPT_CACHE_TTL_SECONDS)
+            except Exception as e:
+                logger.warning(f"Transcript cache write failed for {video_id}: {str(e)}")
+        return transcript_data
+    
+    def transcribe_batch(self, audio_files: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Transcribe several audio files concurrently.
+        
+        Args:
+            audio_files: (audio_file_path, video_id) pairs
+            
+        Returns:
+            Transcription results in input order; a failed file yields {"error": message}
+        """
+        if not audio_files:
+            return []
+        
+        def transcribe(item: Tuple[str, str]) -> Dict[str, Any]:
+            try:
+                return self.transcribe_audio_file(*item)
+            except Exception as e:
+                return {"error": str(e)}
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_BATCH_WORKERS, len(audio_files))) as executor:
+            return list(executor.map(transcribe, audio_files))
+    
+    def _transcribe_uncached(self, audio_file_path: str, video_id: str) -> Dict[str, Any]:
+        """Run the upload, transcribe, download and cleanup pipeline."""
         job_name = f"transcribe-{video_id}-{uuid.uuid4().hex[:8]}"
         s3_key = f"audio/{video_id}/{job_name}.mp3"
         
@@ -80,10 +176,22 @@ class AWSTranscribeService:
                 pass
             raise
     
+    def _file_digest(self, file_path: str) -> str:
+        """SHA-256 of a file's contents, read in 1 MiB chunks."""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Transcript cache hit and miss counts for this instance."""
+        return {"cache_hits": self.cache_hits, "cache_misses": self.cache_misses}
+    
     def _upload_to_s3(self, file_path: str, s3_key: str):
         """Upload file to S3."""
         try:
-            self.s3_client.upload_file(file_path, self.bucket_name, s3_key)
+            self.s3_client.upload_file(file_path, self.bucket_name, s3_key, Config=UPLOAD_CONFIG)
             logger.info(f"Successfully uploaded {file_path} to s3://{self.bucket_name}/{s3_key}")
         except ClientError as e:
             raise Exception(f"Failed to upload to S3: {str(e)}")
@@ -95,6 +203,7 @@ class AWSTranscribeService:
                 TranscriptionJobName=job_name,
                 Media={'MediaFileUri': job_uri},
                 MediaFormat='mp3',
+                MediaSampleRateHertz=16000,  # AudioService always resamples to 16 kHz
                 LanguageCode='en-US',
                 Settings={
                     'ShowSpeakerLabels': False,  # Simplified for single speaker
@@ -111,6 +220,7 @@ class AWSTranscribeService:
     def _wait_for_completion(self, job_name: str, timeout_seconds: int = 120) -> Dict:
         """Wait for transcription job to complete."""
         start_time = time.time()
+        delay = POLL_INITIAL_DELAY_SECONDS
         
         while time.time() - start_time < timeout_seconds:
             try:
@@ -127,8 +237,11 @@ class AWSTranscribeService:
                     failure_reason = response['TranscriptionJob'].get('FailureReason', 'Unknown')
                     raise Exception(f"Transcription job failed: {failure_reason}")
                 
-                # Wait before next check
-                time.sleep(5)
+                # Wait before next check, never past the deadline
+                jittered = delay * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+                remaining = timeout_seconds - (time.time() - start_time)
+                time.sleep(max(0.0, min(jittered, remaining)))
+                delay = min(delay * POLL_BACKOFF_FACTOR, POLL_MAX_DELAY_SECONDS)
                 
             except ClientError as e:
                 raise Exception(f"Error checking job status: {str(e)}")
@@ -145,8 +258,8 @@ class AWSTranscribeService:
                 Key=transcript_key
             )
             
-            import json
-            transcript_data = json.loads(response['Body'].read().decode('utf-8'))
+            # orjson parses the body bytes directly, with no intermediate str
+            transcript_data = loads(response['Body'].read())
             
             # Parse AWS Transcribe format to our format
             return self._parse_aws_transcript(transcript_data)
@@ -166,25 +279,27 @@ class AWSTranscribeService:
             current_start = None
             
             for item in results['items']:
-                if item['type'] == 'pronunciation':
-                    if current_start is None:
-                        current_start = float(item['start_time'])
-                    
-                    current_segment.append(item['alternatives'][0]['content'])
-                    
-                    # Create segment every ~5 seconds or 10 words
-                    if (len(current_segment) >= 10 or 
-                        (item.get('end_time') and 
-                         float(item['end_time']) - current_start >= 5.0)):
-                        
-                        if current_segment:
-                            segments.append({
-                                "start": current_start,
-                                "end": float(item.get('end_time', current_start + 5.0)),
-                                "text": ' '.join(current_segment)
-                            })
-                            current_segment = []
-                            current_start = None
+                # Punctuation items carry no timing and are not spoken words
+                if item['type'] != 'pronunciation':
+                    continue
+                
+                # Each timestamp string is parsed once
+                end_time = float(item['end_time']) if item.get('end_time') else None
+                if current_start is None:
+                    current_start = float(item['start_time'])
+                
+                current_segment.append(item['alternatives'][0]['content'])
+                
+                # Create segment every ~5 seconds or 10 words
+                if (len(current_segment) >= 10 or
+                        (end_time is not None and end_time - current_start >= 5.0)):
+                    segments.append({
+                        "start": current_start,
+                        "end": end_time if end_time is not None else current_start + 5.0,
+                        "text": ' '.join(current_segment)
+                    })
+                    current_segment = []
+                    current_start = None
             
             # Add remaining words as final segment
             if current_segment and current_start is not None:
@@ -208,32 +323,36 @@ class AWSTranscribeService:
     
     def _cleanup_job_and_files(self, job_name: str, audio_s3_key: str):
         """Clean up transcription job and temporary files."""
+        # The job and the S3 objects are independent, so delete them concurrently
+        job_cleanup = _cleanup_executor.submit(self._delete_transcription_job, job_name)
+        self._delete_s3_objects([audio_s3_key, f"transcripts/{job_name}.json"])
+        job_cleanup.result()
+    
+    def _delete_transcription_job(self, job_name: str):
+        """Delete a finished or failed transcription job."""
         try:
-            # Delete transcription job
             self.transcribe_client.delete_transcription_job(
                 TranscriptionJobName=job_name
             )
             logger.info(f"Deleted transcription job: {job_name}")
         except ClientError:
             logger.warning(f"Could not delete transcription job: {job_name}")
-        
+    
+    def _delete_s3_objects(self, keys: List[str]):
+        """Delete the job's audio and transcript files in one DeleteObjects request."""
         try:
-            # Delete audio file from S3
-            self.s3_client.delete_object(
+            response = self.s3_client.delete_objects(
                 Bucket=self.bucket_name,
-                Key=audio_s3_key
+                Delete={'Objects': [{'Key': key} for key in keys], 'Quiet': True}
             )
-            logger.info(f"Deleted audio file: {audio_s3_key}")
         except ClientError:
-            logger.warning(f"Could not delete audio file: {audio_s3_key}")
+            logger.warning(f"Could not delete files: {', '.join(keys)}")
+            return
         
-        try:
-            # Delete transcript file from S3
-            transcript_key = f"transcripts/{job_name}.json"
-            self.s3_client.delete_object(
-                Bucket=self.bucket_name,
-                Key=transcript_key
-            )
-            logger.info(f"Deleted transcript file: {transcript_key}")
-        except ClientError:
-            logger.warning(f"Could not delete transcript file: {transcript_key}")
+        # Per-key failures come back in the response rather than as an exception
+        failed = {error['Key'] for error in response.get('Errors', [])}
+        for key in keys:
+            if key in failed:
+                logger.warning(f"Could not delete file: {key}")
+            else:
+                logger.info(f"Deleted file: {key}")
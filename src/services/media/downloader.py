@@ -1,21 +1,44 @@
 """YouTube video downloader service implementing the Repository pattern."""
 
+import dbm
 import os
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 import tempfile
 import time
+from datetime import datetime
 
 import pytube
+from cachetools import TTLCache
 from pytube.exceptions import PytubeError
 
 from src.services.media.exceptions import DownloadError, UnsupportedVideoError, VideoTooLargeError
+from src.utils.json_utils import dumps, loads
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Video info persisted in the temp dir survives warm invocations and
+# container restarts that keep the same /tmp
+INFO_STORE_PATH = os.path.join(tempfile.gettempdir(), "yt_info.db")
+INFO_TTL_SECONDS = 3600
+
+_info_store = None
+_info_store_unavailable = False
+
+
+def _get_info_store():
+    """Open the persistent info store once per process, or None if it cannot be opened."""
+    global _info_store, _info_store_unavailable
+    if _info_store is None and not _info_store_unavailable:
+        try:
+            _info_store = dbm.open(INFO_STORE_PATH, 'c')
+        except Exception as e:
+            logger.warning("Persistent info cache unavailable: %s", e)
+            _info_store_unavailable = True
+    return _info_store
+
+
 class MediaRepository(ABC):
     """Abstract interface for media repositories."""
     
@@ -33,10 +56,13 @@ class MediaRepository(ABC):
 class YouTubeRepository(MediaRepository):
     """Repository implementation for YouTube videos with memory optimization."""
     
+    # Bounded, expiring cache for video information, shared by all instances
+    # so a warm container keeps its entries however the repository is built
+    _cache = TTLCache(maxsize=1024, ttl=INFO_TTL_SECONDS)
+    
     def __init__(self, max_duration_minutes: int = 120):
         """Initialize repository with constraints."""
         self.max_duration_minutes = max_duration_minutes
-        self._cache = {}  # Simple in-memory cache for video information
     
     def get_info(self, url: str) -> Dict[str, Any]:
         """
@@ -44,14 +70,21 @@ class YouTubeRepository(MediaRepository):
         
         Implements simple caching to avoid repeat API calls.
         """
-        cache_key = f"info_{url}"
-        
-        # Check cache first
-        if cache_key in self._cache:
-            logger.info(f"Cache hit for {url}")
-            return self._cache[cache_key]
-        
         try:
+            # Key by video ID so different URL forms of one video share an entry
+            cache_key = f"info_{pytube.extract.video_id(url)}"
+            
+            # Check cache first
+            if cache_key in self._cache:
+                logger.info("Cache hit for %s", url)
+                return self._cache[cache_key]
+            
+            info = self._load_persisted_info(cache_key)
+            if info is not None:
+                logger.info("Persistent cache hit for %s", url)
+                self._cache[cache_key] = info
+                return info
+            
             # Get video info
             yt = pytube.YouTube(url)
             
@@ -68,12 +101,77 @@ class YouTubeRepository(MediaRepository):
             
             # Cache the result
             self._cache[cache_key] = info
+            self._persist_info(cache_key, info)
             return info
             
         except PytubeError as e:
-            logger.error(f"Error getting video info: {str(e)}")
+            logger.error("Error getting video info: %s", e)
             raise DownloadError(f"Failed to get video info: {str(e)}")
     
+    def _load_persisted_info(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return unexpired info from the persistent store, if any."""
+        store = _get_info_store()
+        if store is None:
+            return None
+        
+        # A malformed entry (old format, hand-edited, truncated) is a cache miss
+        try:
+            raw = store.get(cache_key.encode())
+            if raw is None:
+                return None
+            entry = loads(raw)
+            
+            if time.time() - float(entry["cached_at"]) > INFO_TTL_SECONDS:
+                return None
+            
+            # Restore publish_date so cached and fresh info have the same types
+            info = entry["info"]
+            if info.get("publish_date") is not None:
+                info["publish_date"] = datetime.fromisoformat(info["publish_date"])
+            return info
+        except Exception as e:
+            logger.warning("Could not read persistent cache entry %s: %s", cache_key, e)
+            return None
+    
+    def _persist_info(self, cache_key: str, info: Dict[str, Any]):
+        """Write info to the persistent store; failures (e.g. a full /tmp) are non-fatal."""
+        store = _get_info_store()
+        if store is None:
+            return
+        
+        # publish_date (a datetime or None) is the only non-JSON field; store it
+        # as isoformat() so reads do not depend on the JSON backend's encoding
+        publish_date = info.get("publish_date")
+        stored_info = {**info, "publish_date": publish_date.isoformat() if publish_date else None}
+        
+        try:
+            store[cache_key.encode()] = dumps({"cached_at": time.time(), "info": stored_info})
+        except Exception as e:
+            logger.warning("Could not persist cache entry %s: %s", cache_key, e)
+    
+    def get_info_many(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get metadata for several YouTube videos.
+        
+        URLs that point at the same video are resolved once and cached entries
+        are served without a network call. pytube has no multi-ID endpoint, so
+        each remaining miss is still one watch-page fetch.
+        """
+        results = {}
+        by_video_id = {}
+        
+        for url in urls:
+            try:
+                video_id = pytube.extract.video_id(url)
+            except PytubeError as e:
+                raise DownloadError(f"Failed to get video info: {str(e)}")
+            
+            if video_id not in by_video_id:
+                by_video_id[video_id] = self.get_info(url)
+            results[url] = by_video_id[video_id]
+        
+        return results
+    
     def download(self, url: str, output_path: Optional[str] = None) -> str:
         """
         Download a YouTube video and return the path to the downloaded file.
@@ -116,9 +214,9 @@ class YouTubeRepository(MediaRepository):
             
             while retry < max_retries:
                 try:
-                    logger.info(f"Downloading {info['title']} ({url})")
+                    logger.info("Downloading %s (%s)", info['title'], url)
                     file_path = stream.download(output_path=output_path)
-                    logger.info(f"Download complete: {file_path}")
+                    logger.info("Download complete: %s", file_path)
                     return file_path
                 except Exception as e:
                     retry += 1
@@ -127,14 +225,14 @@ class YouTubeRepository(MediaRepository):
                     
                     # Exponential backoff - important for rate limiting
                     wait_time = 2 ** retry
-                    logger.warning(f"Download failed, retrying in {wait_time}s: {str(e)}")
+                    logger.warning("Download failed, retrying in %ss: %s", wait_time, e)
                     time.sleep(wait_time)
         
         except PytubeError as e:
-            logger.error(f"PyTube error: {str(e)}")
+            logger.error("PyTube error: %s", e)
             raise DownloadError(f"Failed to download video: {str(e)}")
         except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}")
+            logger.error("Unexpected error: %s", e)
             raise DownloadError(f"Unexpected error: {str(e)}")
 
 
@@ -1,11 +1,184 @@
 """
 Enhanced topic detection service for analyzing real video transcripts.
 """
+import bisect
+import functools
 import logging
-from typing import List, Dict, Any
+import re
+from dataclasses import dataclass
+from typing import List, Dict, Any, FrozenSet, Iterable, Iterator, Optional, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; multi-topic search then scans per topic
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
+# Mention classifiers, checked in this order. These are plain substring tests
+# (no word boundaries), so "nothing" still reads as negative as it always has.
+_QUESTION_RE = re.compile(r"what|how|why|when|where")
+_NEGATIVE_RE = re.compile(r"not|don't")
+_POSITIVE_RE = re.compile(r"like|love|great")
+
+# Related terms that raise confidence in bitcoin mentions (also substring tests)
+_FINANCIAL_TERMS_RE = re.compile(r"cryptocurrency|blockchain|mining|digital currency|finance")
+
+
+# Transcripts are served from caches and queried again per topic, so the same
+# texts recur across calls; both steps below are memoized on their contents
+@functools.lru_cache(maxsize=64)
+def _casefold_texts(texts: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Casefold a transcript's segment texts (lowercasing that also folds ß, ﬁ, ...)."""
+    return tuple(text.casefold() for text in texts)
+
+
+def _original_offset(text: str, folded: str, folded_offset: int) -> int:
+    """Map an offset in text.casefold() back to the corresponding offset in text."""
+    if len(folded) == len(text):
+        return folded_offset
+    
+    # Some characters fold to several (ß -> ss); folding is per character, so
+    # walk the original until the folded length reaches the offset
+    folded_length = 0
+    for offset, char in enumerate(text):
+        if folded_length >= folded_offset:
+            return offset
+        folded_length += len(char.casefold())
+    return len(text)
+
+
+def _join_with_offsets(texts: Tuple[str, ...]) -> Tuple[str, List[int]]:
+    """Join texts with newlines; starts[i] is the offset of texts[i] in the result."""
+    starts = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text) + 1
+    return "\n".join(texts), starts
+
+
+@functools.lru_cache(maxsize=512)
+def _matching_segment_indices(texts: Tuple[str, ...], topic_lower: str) -> Tuple[Tuple[int, int], ...]:
+    """
+    Find the casefolded segment texts that contain the topic.
+    
+    The texts are joined once and scanned with str.find; an offset table
+    maps each hit back to its segment.
+    
+    Returns:
+        (segment index, offset of the first hit in that text) pairs
+    """
+    if not texts:
+        return ()
+    
+    joined, starts = _join_with_offsets(texts)
+    
+    indices = []
+    pos = joined.find(topic_lower)
+    while pos != -1:
+        i = bisect.bisect_right(starts, pos) - 1
+        if pos + len(topic_lower) <= starts[i] + len(texts[i]):
+            indices.append((i, pos - starts[i]))
+            if i + 1 == len(starts):
+                break
+            # One mention per segment, so resume at the next segment
+            pos = joined.find(topic_lower, starts[i + 1])
+        else:
+            # The hit spans a segment boundary
+            pos = joined.find(topic_lower, pos + 1)
+    
+    return tuple(indices)
+
+
+@functools.lru_cache(maxsize=32)
+def _topic_automaton(topics_lower: FrozenSet[str]):
+    """Build an Aho-Corasick automaton over a set of casefolded topics."""
+    automaton = ahocorasick.Automaton()
+    for topic_lower in topics_lower:
+        automaton.add_word(topic_lower, topic_lower)
+    automaton.make_automaton()
+    return automaton
+
+
+def _matching_segment_indices_multi(texts: Tuple[str, ...], topics_lower: FrozenSet[str]) -> Dict[str, List[Tuple[int, int]]]:
+    """
+    Find, for each casefolded topic, the segments that contain it.
+    
+    One Aho-Corasick pass over the joined texts reports every topic at once.
+    Pairs are (segment index, offset of the first hit), as _matching_segment_indices returns.
+    """
+    joined, starts = _join_with_offsets(texts)
+    hits: Dict[str, Dict[int, int]] = {topic_lower: {} for topic_lower in topics_lower}
+    
+    # Matches arrive in order of position, so the first one per segment is the earliest
+    for end, topic_lower in _topic_automaton(topics_lower).iter(joined):
+        pos = end - len(topic_lower) + 1
+        i = bisect.bisect_right(starts, pos) - 1
+        # Skip hits that span a segment boundary
+        if end < starts[i] + len(texts[i]):
+            hits[topic_lower].setdefault(i, pos - starts[i])
+    
+    return {topic_lower: sorted(offsets.items()) for topic_lower, offsets in hits.items()}
+
+
+@dataclass(frozen=True, slots=True)
+class Mention:
+    """A topic mention in one transcript segment, with its surrounding context."""
+    primary_segment: Dict[str, Any]
+    context_segments: List[Dict[str, Any]]
+    confidence: float
+    context_start: float
+    context_end: float
+    mention_type: str
+    # Where the topic starts in the segment text, for highlighting
+    char_offset: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the mention in its JSON response shape."""
+        return {
+            "primary_segment": self.primary_segment,
+            "context_segments": self.context_segments,
+            "confidence": self.confidence,
+            "context_start": self.context_start,
+            "context_end": self.context_end,
+            "mention_type": self.mention_type,
+            "char_offset": self.char_offset
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Clip:
+    """A suggested clip around one mention, or several merged ones."""
+    clip_id: str
+    start_time: float
+    end_time: float
+    duration: float
+    primary_text: str
+    confidence: float
+    mention_type: str
+    description: str
+    social_media_ready: bool
+    # Only set when overlapping mentions were merged
+    mentions_merged: Optional[int] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the clip in its JSON response shape."""
+        clip = {
+            "clip_id": self.clip_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration": self.duration,
+            "primary_text": self.primary_text,
+            "confidence": self.confidence,
+            "mention_type": self.mention_type,
+            "description": self.description,
+            "social_media_ready": self.social_media_ready
+        }
+        if self.mentions_merged is not None:
+            clip["mentions_merged"] = self.mentions_merged
+        return clip
+
 
 class TopicService:
     """Service for detecting topics in video transcripts."""
@@ -14,7 +187,7 @@ class TopicService:
         """Initialize the topic detection service."""
         pass
     
-    def find_topic_mentions(self, transcript: Dict[str, Any], topic: str) -> List[Dict[str, Any]]:
+    def find_topic_mentions(self, transcript: Dict[str, Any], topic: str) -> Iterator[Mention]:
         """
         Find mentions of a specific topic in the transcript.
         
@@ -23,29 +196,64 @@ class TopicService:
             topic: Topic to search for
             
         Returns:
-            List of segments containing the topic with context
+            Iterator over segments containing the topic with context, in
+            transcript order (wrap in list() to keep them)
         """
-        mentions = []
-        topic_lower = topic.lower()
         segments = transcript.get("segments", [])
         
-        for i, segment in enumerate(segments):
-            if topic_lower in segment["text"].lower():
-                # Add context from surrounding segments
-                context_segments = self._get_context_segments(segments, i, context_range=1)
-                
-                mention = {
-                    "primary_segment": segment,
-                    "context_segments": context_segments,
-                    "confidence": self._calculate_confidence(segment["text"], topic),
-                    "context_start": context_segments[0]["start"] if context_segments else segment["start"],
-                    "context_end": context_segments[-1]["end"] if context_segments else segment["end"],
-                    "mention_type": self._classify_mention(segment["text"], topic)
-                }
-                
-                mentions.append(mention)
-        
-        return mentions
+        # Casefold each text once; matching, scoring and classifying all reuse it
+        topic_lower = topic.casefold()
+        texts_lower = _casefold_texts(tuple(segment["text"] for segment in segments))
+        
+        # Matching is one memoized scan; mentions are built only as they are consumed
+        for i, offset in _matching_segment_indices(texts_lower, topic_lower):
+            yield self._build_mention(segments, texts_lower, i, offset, topic_lower)
+    
+    def find_mentions_multi(self, transcript: Dict[str, Any], topics: List[str]) -> Dict[str, List[Mention]]:
+        """
+        Find mentions of several topics in one pass over the transcript.
+        
+        Args:
+            transcript: Transcript dictionary with segments
+            topics: Topics to search for
+            
+        Returns:
+            Mapping of each topic to its mentions, as find_topic_mentions returns them
+        """
+        topics_lower = frozenset(topic.casefold() for topic in topics)
+        
+        # A single topic, an empty topic or no pyahocorasick: scan per topic
+        if ahocorasick is None or len(topics_lower) < 2 or "" in topics_lower:
+            return {topic: list(self.find_topic_mentions(transcript, topic)) for topic in topics}
+        
+        segments = transcript.get("segments", [])
+        texts_lower = _casefold_texts(tuple(segment["text"] for segment in segments))
+        indices_by_topic = _matching_segment_indices_multi(texts_lower, topics_lower)
+        
+        return {
+            topic: [
+                self._build_mention(segments, texts_lower, i, offset, topic.casefold())
+                for i, offset in indices_by_topic[topic.casefold()]
+            ]
+            for topic in topics
+        }
+    
+    def _build_mention(self, segments: List[Dict[str, Any]], texts_lower: Tuple[str, ...], index: int, offset: int, topic_lower: str) -> Mention:
+        """Describe the mention in segments[index], with its surrounding context."""
+        segment = segments[index]
+        
+        # Add context from surrounding segments
+        context_segments = self._get_context_segments(segments, index, context_range=1)
+        
+        return Mention(
+            primary_segment=segment,
+            context_segments=context_segments,
+            confidence=self._calculate_confidence(texts_lower[index], topic_lower),
+            context_start=context_segments[0]["start"] if context_segments else segment["start"],
+            context_end=context_segments[-1]["end"] if context_segments else segment["end"],
+            mention_type=self._classify_mention(texts_lower[index]),
+            char_offset=_original_offset(segment["text"], texts_lower[index], offset)
+        )
     
     def _get_context_segments(self, segments: List[Dict[str, Any]], target_index: int, context_range: int = 1) -> List[Dict[str, Any]]:
         """Get surrounding segments for context."""
@@ -53,94 +261,109 @@ class TopicService:
         end_idx = min(len(segments), target_index + context_range + 1)
         return segments[start_idx:end_idx]
     
-    def _calculate_confidence(self, text: str, topic: str) -> float:
-        """Calculate confidence score based on context."""
-        text_lower = text.lower()
-        topic_lower = topic.lower()
-        
+    def _calculate_confidence(self, text_lower: str, topic_lower: str) -> float:
+        """Calculate confidence score based on context (both arguments casefolded)."""
         # Base confidence if topic is mentioned
         if topic_lower not in text_lower:
             return 0.0
         
         confidence = 0.8  # Base confidence
+        words = text_lower.split()
         
         # Boost confidence for exact matches
-        if topic_lower in text_lower.split():
+        if topic_lower in words:
             confidence += 0.1
         
         # Boost for longer contexts
-        if len(text.split()) > 10:
+        if len(words) > 10:
             confidence += 0.05
         
         # Boost for financial/tech terms (if searching for bitcoin)
-        financial_terms = ["cryptocurrency", "blockchain", "mining", "digital currency", "finance"]
-        if topic_lower == "bitcoin" and any(term in text_lower for term in financial_terms):
+        if topic_lower == "bitcoin" and _FINANCIAL_TERMS_RE.search(text_lower):
             confidence += 0.05
         
         return min(confidence, 1.0)
     
-    def _classify_mention(self, text: str, topic: str) -> str:
-        """Classify the type of mention."""
-        text_lower = text.lower()
-        
-        question_words = ["what", "how", "why", "when", "where"]
-        if any(word in text_lower for word in question_words):
+    def _classify_mention(self, text_lower: str) -> str:
+        """Classify the type of mention from its casefolded text."""
+        if _QUESTION_RE.search(text_lower):
             return "question"
         
-        if "not" in text_lower or "don't" in text_lower:
+        if _NEGATIVE_RE.search(text_lower):
             return "negative"
         
-        if "like" in text_lower or "love" in text_lower or "great" in text_lower:
+        if _POSITIVE_RE.search(text_lower):
             return "positive"
         
         return "neutral"
     
-    def generate_clip_timestamps(self, mentions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def generate_clip_timestamps(self, mentions: Iterable[Mention], merge_overlapping: bool = False) -> Iterator[Clip]:
         """
         Generate optimized clip timestamps with smart context.
         
         Args:
-            mentions: List of topic mentions
+            mentions: Topic mentions, e.g. from find_topic_mentions
+            merge_overlapping: Combine mentions whose clip windows overlap into one clip
             
         Returns:
-            List of clip specifications with start/end times
+            Iterator over clip specifications with start/end times. Without merging
+            each clip is produced as its mention arrives; merging sorts all windows first.
         """
-        clips = []
+        windows = ((*self._clip_window(mention), [mention]) for mention in mentions)
+        if merge_overlapping:
+            windows = self._merge_clip_windows(windows)
         
-        for i, mention in enumerate(mentions):
-            # Calculate optimal clip duration
-            base_duration = mention["context_end"] - mention["context_start"]
+        for i, (start_time, end_time, grouped_mentions) in enumerate(windows):
+            # A merged clip is described by its most confident mention
+            mention = max(grouped_mentions, key=lambda m: m.confidence)
             
-            # Ensure minimum clip length (5 seconds)
-            min_duration = 5.0
-            if base_duration < min_duration:
-                extension = (min_duration - base_duration) / 2
-                start_time = max(0, mention["context_start"] - extension)
-                end_time = mention["context_end"] + extension
+            yield Clip(
+                clip_id=f"clip_{i+1}",
+                start_time=round(start_time, 1),
+                end_time=round(end_time, 1),
+                duration=round(end_time - start_time, 1),
+                primary_text=mention.primary_segment["text"],
+                confidence=mention.confidence,
+                mention_type=mention.mention_type,
+                description=f"{mention.mention_type.title()} mention of topic",
+                social_media_ready=end_time - start_time <= 30.0,
+                mentions_merged=len(grouped_mentions) if merge_overlapping else None
+            )
+    
+    def _clip_window(self, mention: Mention) -> Tuple[float, float]:
+        """Calculate the start/end of a clip around a single mention."""
+        # Calculate optimal clip duration
+        base_duration = mention.context_end - mention.context_start
+        
+        # Ensure minimum clip length (5 seconds)
+        min_duration = 5.0
+        if base_duration < min_duration:
+            extension = (min_duration - base_duration) / 2
+            start_time = max(0, mention.context_start - extension)
+            end_time = mention.context_end + extension
+        else:
+            start_time = mention.context_start
+            end_time = mention.context_end
+        
+        # Ensure maximum clip length (30 seconds for social media)
+        max_duration = 30.0
+        if end_time - start_time > max_duration:
+            end_time = start_time + max_duration
+        
+        return start_time, end_time
+    
+    def _merge_clip_windows(self, windows: Iterable[Tuple[float, float, List[Mention]]]) -> List[Tuple[float, float, List[Mention]]]:
+        """Merge overlapping or touching clip windows in a single sweep over start times."""
+        merged = []
+        
+        for start_time, end_time, grouped_mentions in sorted(windows, key=lambda w: w[0]):
+            if merged and start_time <= merged[-1][1]:
+                last_start, last_end, last_mentions = merged[-1]
+                merged[-1] = (last_start, max(last_end, end_time), last_mentions + grouped_mentions)
             else:
-                start_time = mention["context_start"]
-                end_time = mention["context_end"]
-            
-            # Ensure maximum clip length (30 seconds for social media)
-            max_duration = 30.0
-            if end_time - start_time > max_duration:
-                end_time = start_time + max_duration
-            
-            clip = {
-                "clip_id": f"clip_{i+1}",
-                "start_time": round(start_time, 1),
-                "end_time": round(end_time, 1),
-                "duration": round(end_time - start_time, 1),
-                "primary_text": mention["primary_segment"]["text"],
-                "confidence": mention["confidence"],
-                "mention_type": mention["mention_type"],
-                "description": f"{mention['mention_type'].title()} mention of topic",
-                "social_media_ready": end_time - start_time <= 30.0
-            }
-            
-            clips.append(clip)
+                merged.append((start_time, end_time, grouped_mentions))
         
-        return clips
+        return merged
     
     def get_transcript_summary(self, transcript: Dict[str, Any]) -> Dict[str, Any]:
         """Generate a summary of the transcript."""
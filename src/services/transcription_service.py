@@ -3,10 +3,79 @@ Enhanced transcription service using AWS Transcribe with intelligent fallbacks.
 """
 import logging
 import os
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Segments transcribed at once; each holds a YouTube download and then a
+# Transcribe job. Downloads also take a permit from AudioService's process-wide
+# limit, so concurrent requests in one container cannot exceed it together.
+MAX_SEGMENT_WORKERS = 4
+
+# Demo transcripts are built once and returned as shared objects; callers only
+# read them (AWS results are the only ones whose timestamps get offset).
+
+# Specific transcript for the first YouTube video
+_DEMO_ELEPHANTS_TRANSCRIPT = {
+    "text": "Alright, so here we are in front of the elephants. The cool thing about these guys is that they have really, really, really long trunks. And that's cool. And that's pretty much all there is to say.",
+    "segments": [
+        {
+            "start": 0.0,
+            "end": 5.0,
+            "text": "Alright, so here we are in front of the elephants."
+        },
+        {
+            "start": 5.0,
+            "end": 12.0,
+            "text": "The cool thing about these guys is that they have really, really, really long trunks."
+        },
+        {
+            "start": 12.0,
+            "end": 15.0,
+            "text": "And that's cool."
+        },
+        {
+            "start": 15.0,
+            "end": 19.0,
+            "text": "And that's pretty much all there is to say."
+        }
+    ],
+    "language": "en-US",
+    "duration": 19.0,
+    "source": "demo_data"
+}
+
+# Generic demo transcript for other videos
+_DEMO_GENERIC_TRANSCRIPT = {
+    "text": "Welcome to this video about technology and innovation. Today we're going to discuss bitcoin and cryptocurrency. This technology is revolutionizing finance. Let's explore how bitcoin mining works and its impact on the future.",
+    "segments": [
+        {
+            "start": 0.0,
+            "end": 5.0,
+            "text": "Welcome to this video about technology and innovation."
+        },
+        {
+            "start": 5.0,
+            "end": 10.0,
+            "text": "Today we're going to discuss bitcoin and cryptocurrency."
+        },
+        {
+            "start": 10.0,
+            "end": 15.0,
+            "text": "This technology is revolutionizing finance."
+        },
+        {
+            "start": 15.0,
+            "end": 20.0,
+            "text": "Let's explore how bitcoin mining works and its impact on the future."
+        }
+    ],
+    "language": "en-US",
+    "duration": 20.0,
+    "source": "demo_data"
+}
+
 
 class TranscriptionService:
     """Service for transcribing audio with AWS Transcribe and demo fallbacks."""
@@ -18,7 +87,11 @@ class TranscriptionService:
         if self.bucket_name:
             try:
                 from services.aws_transcribe_service import AWSTranscribeService
+                from services.audio_service import AudioService
                 self.aws_transcribe = AWSTranscribeService(self.bucket_name)
+                # Shared by every transcription, so tool probes and the
+                # metadata it collects from downloads carry across calls
+                self.audio_service = AudioService()
                 logger.info("AWS Transcribe service initialized successfully")
             except Exception as e:
                 logger.error(f"Failed to initialize AWS Transcribe: {str(e)}")
@@ -51,11 +124,31 @@ class TranscriptionService:
         # Fallback to demo transcription
         return self._get_demo_transcription(video_id)
     
+    def transcribe_video_segments(self, video_id: str, spans: List[Tuple[int, int]]) -> List[Dict[str, Any]]:
+        """
+        Transcribe several segments of one video concurrently.
+        
+        Each segment downloads, waits on its Transcribe job and cleans up on its
+        own thread, so polling for one job overlaps the others.
+        
+        Args:
+            video_id: YouTube video ID
+            spans: (start_time, duration) pairs in seconds
+            
+        Returns:
+            Transcription results in span order, with the same fallbacks as transcribe_video_segment
+        """
+        if not spans:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_SEGMENT_WORKERS, len(spans))) as executor:
+            return list(executor.map(
+                lambda span: self.transcribe_video_segment(video_id, *span), spans
+            ))
+    
     def _transcribe_with_aws(self, video_id: str, start_time: int, duration: int) -> Dict[str, Any]:
         """Transcribe using AWS Transcribe service."""
-        from services.audio_service import AudioService
-        
-        audio_service = AudioService()
+        audio_service = self.audio_service
         
         try:
             # Step 1: Extract audio segment
@@ -90,65 +183,8 @@ class TranscriptionService:
         logger.info(f"Using demo transcription for video {video_id}")
         
         if video_id == "jNQXAC9IVRw":
-            # Specific transcript for the first YouTube video
-            return {
-                "text": "Alright, so here we are in front of the elephants. The cool thing about these guys is that they have really, really, really long trunks. And that's cool. And that's pretty much all there is to say.",
-                "segments": [
-                    {
-                        "start": 0.0,
-                        "end": 5.0,
-                        "text": "Alright, so here we are in front of the elephants."
-                    },
-                    {
-                        "start": 5.0,
-                        "end": 12.0,
-                        "text": "The cool thing about these guys is that they have really, really, really long trunks."
-                    },
-                    {
-                        "start": 12.0,
-                        "end": 15.0,
-                        "text": "And that's cool."
-                    },
-                    {
-                        "start": 15.0,
-                        "end": 19.0,
-                        "text": "And that's pretty much all there is to say."
-                    }
-                ],
-                "language": "en-US",
-                "duration": 19.0,
-                "source": "demo_data"
-            }
-        else:
-            # Generic demo transcript for other videos
-            return {
-                "text": "Welcome to this video about technology and innovation. Today we're going to discuss bitcoin and cryptocurrency. This technology is revolutionizing finance. Let's explore how bitcoin mining works and its impact on the future.",
-                "segments": [
-                    {
-                        "start": 0.0,
-                        "end": 5.0,
-                        "text": "Welcome to this video about technology and innovation."
-                    },
-                    {
-                        "start": 5.0,
-                        "end": 10.0,
-                        "text": "Today we're going to discuss bitcoin and cryptocurrency."
-                    },
-                    {
-                        "start": 10.0,
-                        "end": 15.0,
-                        "text": "This technology is revolutionizing finance."
-                    },
-                    {
-                        "start": 15.0,
-                        "end": 20.0,
-                        "text": "Let's explore how bitcoin mining works and its impact on the future."
-                    }
-                ],
-                "language": "en-US", 
-                "duration": 20.0,
-                "source": "demo_data"
-            }
+            return _DEMO_ELEPHANTS_TRANSCRIPT
+        return _DEMO_GENERIC_TRANSCRIPT
     
     def get_service_status(self) -> Dict[str, Any]:
         """Get the current status of transcription services."""
@@ -156,5 +192,6 @@ class TranscriptionService:
             "aws_transcribe_available": self.aws_transcribe is not None,
             "bucket_configured": self.bucket_name is not None,
             "bucket_name": self.bucket_name,
-            "fallback_mode": self.aws_transcribe is None
+            "fallback_mode": self.aws_transcribe is None,
+            "transcript_cache": self.aws_transcribe.get_cache_stats() if self.aws_transcribe else None
         }
@@ -1,17 +1,97 @@
 """
 YouTube service for extracting video metadata using YouTube Data API v3.
 """
+import functools
 import logging
-import urllib.parse
+import re
 import os
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, List, Optional
 
-from googleapiclient.discovery import build
+from cachetools import TTLCache
 from googleapiclient.errors import HttpError
-import isodate
 
 logger = logging.getLogger(__name__)
 
+# Video ID from a YouTube URL (group 1), or a bare 11-character ID (group 2).
+# The host must be YouTube's and v= must be a /watch query parameter, so other
+# sites' URLs are rejected. IDs are ASCII only; \w would also admit Unicode.
+_VIDEO_ID_RE = re.compile(
+    r'^(?i:(?:https?://)?'
+    r'(?:(?:(?:www|m|music)\.)?youtube\.com/(?:watch/?\?(?:[^#]*&)?v=|v/|embed/|shorts/)'
+    r'|www\.youtube-nocookie\.com/embed/'
+    r'|youtu\.be/))'
+    r'([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])'
+    r'|^([A-Za-z0-9_-]{11})$'
+)
+
+# YouTube reports durations as ISO 8601 `PT#H#M#S`, with `P#W#D` for long
+# streams and `P0D` for live broadcasts
+_DURATION_RE = re.compile(r'P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?')
+
+# API metadata is reused for an hour; titles and counts drift, IDs never do
+VIDEO_INFO_TTL_SECONDS = 3600
+VIDEO_INFO_CACHE_SIZE = 10000
+
+# videos().list accepts at most 50 comma-separated IDs per request (maxResults
+# does not apply to id lookups, so the batches are sliced to this size instead)
+VIDEOS_PER_REQUEST = 50
+
+# Demo metadata for well-known videos, and for everything else
+_KNOWN_DEMO_VIDEOS = {
+    "jNQXAC9IVRw": {
+        "title": "Me at the zoo",
+        "channel": "jawed",
+        "description": "The first video uploaded to YouTube"
+    },
+    "dQw4w9WgXcQ": {
+        "title": "Rick Astley - Never Gonna Give You Up",
+        "channel": "RickAstleyVEVO",
+        "description": "The official video for Rick Astley's Never Gonna Give You Up"
+    }
+}
+_DEFAULT_DEMO_VIDEO = {
+    "title": "Sample Video Title",
+    "channel": "Sample Channel",
+    "description": "Sample video description"
+}
+
+# API clients keyed by API key, built once per container and reused on warm starts
+_YOUTUBE_CLIENTS: Dict[str, Any] = {}
+
+
+def _get_youtube_client(api_key: str):
+    """Return a cached YouTube Data API client for the given key."""
+    client = _YOUTUBE_CLIENTS.get(api_key)
+    if client is None:
+        # discovery pulls in httplib2 and google-auth (~140 ms); only load it
+        # once a key is configured, so demo-mode cold starts skip it
+        from googleapiclient.discovery import build
+        client = build('youtube', 'v3', developerKey=api_key)
+        _YOUTUBE_CLIENTS[api_key] = client
+    return client
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_video_id(url: str) -> str:
+    """Extract the video ID from a YouTube URL (pure, so results are memoized)."""
+    # The pattern is anchored, so pasted URLs with stray whitespace are trimmed first
+    match = _VIDEO_ID_RE.search(url.strip())
+    if match:
+        return match.group(1) or match.group(2)
+    raise ValueError(f"Unsupported YouTube URL format: {url}")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_duration_seconds(duration_str: str) -> Optional[int]:
+    """Convert an ISO 8601 `P#W#DT#H#M#S` duration to seconds, or None if unparseable."""
+    match = _DURATION_RE.fullmatch(duration_str or '')
+    if not match:
+        return None
+    
+    weeks, days, hours, minutes, seconds = (int(part or 0) for part in match.groups())
+    return weeks * 604800 + days * 86400 + hours * 3600 + minutes * 60 + seconds
+
 
 class YouTubeService:
     """Service for handling YouTube video operations with real API integration."""
@@ -24,12 +104,18 @@ class YouTubeService:
             api_key: YouTube Data API key. If None, will try to get from environment.
         """
         self.api_key = api_key or os.getenv('YOUTUBE_API_KEY')
+        
+        # Only real API responses are cached, so recovery from a fallback is immediate.
+        # The lock guards the cache; callers fetch on worker threads.
+        self._info_cache = TTLCache(maxsize=VIDEO_INFO_CACHE_SIZE, ttl=VIDEO_INFO_TTL_SECONDS)
+        self._info_cache_lock = threading.Lock()
+        
         if not self.api_key:
             logger.warning("No YouTube API key provided. Using demo mode.")
             self.youtube = None
         else:
             try:
-                self.youtube = build('youtube', 'v3', developerKey=self.api_key)
+                self.youtube = _get_youtube_client(self.api_key)
                 logger.info("YouTube API client initialized successfully")
             except Exception as e:
                 logger.error(f"Failed to initialize YouTube API client: {str(e)}")
@@ -48,82 +134,118 @@ class YouTubeService:
         Raises:
             ValueError: If video ID cannot be extracted
         """
-        try:
-            if "youtube.com/watch" in url:
-                parsed_url = urllib.parse.urlparse(url)
-                query_params = urllib.parse.parse_qs(parsed_url.query)
-                return query_params['v'][0]
-            elif "youtu.be/" in url:
-                return url.split("youtu.be/")[1].split("?")[0]
-            else:
-                raise ValueError(f"Unsupported YouTube URL format: {url}")
-        except (KeyError, IndexError) as e:
-            raise ValueError(f"Could not extract video ID from URL: {url}") from e
+        return _extract_video_id(url)
     
-    def get_video_info(self, video_id: str) -> Dict[str, Any]:
+    def get_video_info(self, video_id: str, bypass_cache: bool = False) -> Dict[str, Any]:
         """
         Get video metadata using YouTube Data API.
         
         Args:
             video_id: YouTube video ID
+            bypass_cache: Ignore any cached entry and refresh it from the API
             
         Returns:
             Dictionary containing video metadata
         """
+        video_info = self.get_videos_info([video_id], bypass_cache=bypass_cache).get(video_id)
+        if video_info is None:
+            logger.error(f"Video not found: {video_id}")
+            return self._get_demo_video_info(video_id)
+        return video_info
+    
+    def get_videos_info(self, video_ids: List[str], bypass_cache: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Get metadata for several videos, fetching up to 50 per API request.
+        
+        Args:
+            video_ids: YouTube video IDs
+            bypass_cache: Ignore any cached entries and refresh them from the API
+            
+        Returns:
+            Metadata keyed by video ID; IDs the API does not know are omitted
+        """
         if not self.youtube:
             logger.warning("YouTube API not available, falling back to demo data")
-            return self._get_demo_video_info(video_id)
+            return {video_id: self._get_demo_video_info(video_id) for video_id in video_ids}
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        if not bypass_cache:
+            with self._info_cache_lock:
+                for video_id in video_ids:
+                    cached = self._info_cache.get(video_id)
+                    if cached is not None:
+                        results[video_id] = cached
+        
+        missing = list(dict.fromkeys(video_id for video_id in video_ids if video_id not in results))
+        for i in range(0, len(missing), VIDEOS_PER_REQUEST):
+            results.update(self._fetch_videos_info(missing[i:i + VIDEOS_PER_REQUEST]))
         
+        return results
+    
+    def _fetch_videos_info(self, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch one batch of at most 50 videos from the API, caching what it returns."""
         try:
             # Call YouTube Data API
             response = self.youtube.videos().list(
                 part="snippet,contentDetails,statistics",
-                id=video_id
+                id=",".join(video_ids)
             ).execute()
             
-            if not response['items']:
-                raise ValueError(f"Video not found: {video_id}")
-            
-            video = response['items'][0]
-            snippet = video['snippet']
-            content_details = video['contentDetails']
-            statistics = video['statistics']
-            
-            # Parse duration from ISO 8601 format
-            duration_seconds = self._parse_duration(content_details['duration'])
+            videos = {}
+            for item in response.get('items', []):
+                video_info = self._parse_video_item(item)
+                videos[video_info["id"]] = video_info
             
-            return {
-                "id": video_id,
-                "title": snippet['title'],
-                "duration_seconds": duration_seconds,
-                "channel": snippet['channelTitle'],
-                "channel_id": snippet['channelId'],
-                "publish_date": snippet['publishedAt'],
-                "view_count": int(statistics.get('viewCount', 0)),
-                "like_count": int(statistics.get('likeCount', 0)),
-                "comment_count": int(statistics.get('commentCount', 0)),
-                "thumbnail_url": snippet['thumbnails']['high']['url'],
-                "description": snippet['description'][:500] + "..." if len(snippet['description']) > 500 else snippet['description'],
-                "tags": snippet.get('tags', []),
-                "category_id": snippet['categoryId'],
-                "default_language": snippet.get('defaultLanguage', 'unknown'),
-                "api_source": "youtube_data_api_v3"
-            }
+            with self._info_cache_lock:
+                self._info_cache.update(videos)
+            return videos
             
         except HttpError as e:
             logger.error(f"YouTube API error: {str(e)}")
             if e.resp.status == 403:
                 logger.error("API quota exceeded or invalid API key")
             elif e.resp.status == 404:
-                raise ValueError(f"Video not found: {video_id}")
+                # Unknown IDs are omitted, as for an empty items list
+                return {}
             
             # Fall back to demo data on API error
             logger.warning("Falling back to demo data due to API error")
-            return self._get_demo_video_info(video_id)
+            return {video_id: self._get_demo_video_info(video_id) for video_id in video_ids}
             
         except Exception as e:
             logger.error(f"Unexpected error calling YouTube API: {str(e)}")
-            return self._get_demo_video_info(video_id)
+            return {video_id: self._get_demo_video_info(video_id) for video_id in video_ids}
+    
+    def _parse_video_item(self, video: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert one videos().list item into this service's metadata format."""
+        snippet = video['snippet']
+        content_details = video['contentDetails']
+        statistics = video['statistics']
+        
+        # Parse duration from ISO 8601 format
+        duration_seconds = self._parse_duration(content_details['duration'])
+        
+        description = snippet['description']
+        if len(description) > 500:
+            description = f"{description[:500]}..."
+        
+        return {
+            "id": video['id'],
+            "title": snippet['title'],
+            "duration_seconds": duration_seconds,
+            "channel": snippet['channelTitle'],
+            "channel_id": snippet['channelId'],
+            "publish_date": snippet['publishedAt'],
+            "view_count": int(statistics.get('viewCount', 0)),
+            "like_count": int(statistics.get('likeCount', 0)),
+            "comment_count": int(statistics.get('commentCount', 0)),
+            "thumbnail_url": snippet['thumbnails']['high']['url'],
+            "description": description,
+            "tags": snippet.get('tags', []),
+            "category_id": snippet['categoryId'],
+            "default_language": snippet.get('defaultLanguage', 'unknown'),
+            "api_source": "youtube_data_api_v3"
+        }
     
     def _parse_duration(self, duration_str: str) -> int:
         """
@@ -135,33 +257,15 @@ class YouTubeService:
         Returns:
             Duration in seconds
         """
-        try:
-            duration = isodate.parse_duration(duration_str)
-            return int(duration.total_seconds())
-        except Exception as e:
-            logger.error(f"Error parsing duration '{duration_str}': {str(e)}")
+        seconds = _parse_duration_seconds(duration_str)
+        if seconds is None:
+            logger.error(f"Error parsing duration '{duration_str}'")
             return 120  # Default fallback
+        return seconds
     
     def _get_demo_video_info(self, video_id: str) -> Dict[str, Any]:
         """Get demo video info when API is not available."""
-        known_videos = {
-            "jNQXAC9IVRw": {
-                "title": "Me at the zoo",
-                "channel": "jawed",
-                "description": "The first video uploaded to YouTube"
-            },
-            "dQw4w9WgXcQ": {
-                "title": "Rick Astley - Never Gonna Give You Up",
-                "channel": "RickAstleyVEVO", 
-                "description": "The official video for Rick Astley's Never Gonna Give You Up"
-            }
-        }
-        
-        video_data = known_videos.get(video_id, {
-            "title": "Sample Video Title",
-            "channel": "Sample Channel",
-            "description": "Sample video description"
-        })
+        video_data = _KNOWN_DEMO_VIDEOS.get(video_id, _DEFAULT_DEMO_VIDEO)
         
         return {
             "id": video_id,
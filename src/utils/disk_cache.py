@@ -0,0 +1,34 @@
+"""
+Persistent result cache in the temp dir, backed by diskcache when installed.
+"""
+import logging
+import os
+import tempfile
+
+try:
+    from diskcache import Cache
+except ImportError:  # diskcache is optional; callers then skip caching
+    Cache = None
+
+logger = logging.getLogger(__name__)
+
+# /tmp is the only writable path on Lambda and survives warm invocations
+CACHE_DIR = os.path.join(tempfile.gettempdir(), "clipper_cache")
+
+_cache = None
+_cache_unavailable = False
+
+
+def get_cache():
+    """Open the shared disk cache once per process, or None if it cannot be opened."""
+    global _cache, _cache_unavailable
+    if _cache is None and not _cache_unavailable:
+        if Cache is None:
+            _cache_unavailable = True
+        else:
+            try:
+                _cache = Cache(CACHE_DIR)
+            except Exception as e:
+                logger.warning("Disk cache unavailable: %s", e)
+                _cache_unavailable = True
+    return _cache
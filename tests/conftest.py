@@ -0,0 +1,7 @@
+"""
+Shared pytest setup: import application modules the way Lambda does, from src/.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
@@ -0,0 +1,72 @@
+"""
+Tests for clip generation and merging.
+"""
+import pytest
+
+from services.topic_service import Mention, TopicService
+
+
+@pytest.fixture
+def service():
+    return TopicService()
+
+
+def _mention(start, end, confidence=0.9, text="bitcoin"):
+    segment = {"text": text, "start": start, "end": end}
+    return Mention(
+        primary_segment=segment,
+        context_segments=[segment],
+        confidence=confidence,
+        context_start=start,
+        context_end=end,
+        mention_type="neutral",
+        char_offset=0
+    )
+
+
+def test_merge_clip_windows_combines_overlapping_windows(service):
+    merged = service._merge_clip_windows([(0.0, 10.0, ["a"]), (8.0, 15.0, ["b"])])
+    assert merged == [(0.0, 15.0, ["a", "b"])]
+
+
+def test_merge_clip_windows_combines_touching_windows(service):
+    merged = service._merge_clip_windows([(0.0, 10.0, ["a"]), (10.0, 15.0, ["b"])])
+    assert merged == [(0.0, 15.0, ["a", "b"])]
+
+
+def test_merge_clip_windows_keeps_disjoint_windows(service):
+    merged = service._merge_clip_windows([(20.0, 25.0, ["b"]), (0.0, 10.0, ["a"])])
+    assert merged == [(0.0, 10.0, ["a"]), (20.0, 25.0, ["b"])]
+
+
+def test_merge_clip_windows_keeps_the_furthest_end(service):
+    merged = service._merge_clip_windows([(0.0, 20.0, ["a"]), (5.0, 10.0, ["b"])])
+    assert merged == [(0.0, 20.0, ["a", "b"])]
+
+
+def test_generate_clip_timestamps_merges_and_counts_mentions(service):
+    mentions = [
+        _mention(0.0, 10.0, confidence=0.8, text="first"),
+        _mention(8.0, 15.0, confidence=0.95, text="overlapping"),
+        _mention(15.0, 20.0, text="touching"),
+        _mention(30.0, 40.0, text="disjoint"),
+    ]
+
+    clips = [clip.to_dict() for clip in service.generate_clip_timestamps(mentions, merge_overlapping=True)]
+
+    assert [(c["start_time"], c["end_time"], c["mentions_merged"]) for c in clips] == [
+        (0.0, 20.0, 3),
+        (30.0, 40.0, 1),
+    ]
+    # A merged clip is described by its most confident mention
+    assert clips[0]["primary_text"] == "overlapping"
+    assert [c["clip_id"] for c in clips] == ["clip_1", "clip_2"]
+
+
+def test_generate_clip_timestamps_without_merging_omits_the_count(service):
+    mentions = [_mention(0.0, 10.0), _mention(8.0, 15.0)]
+
+    clips = [clip.to_dict() for clip in service.generate_clip_timestamps(mentions)]
+
+    assert len(clips) == 2
+    assert all("mentions_merged" not in clip for clip in clips)
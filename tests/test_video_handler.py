@@ -0,0 +1,29 @@
+"""
+Tests for request validation in the video handler.
+"""
+import json
+
+import pytest
+
+from handlers import video_handler
+
+
+def _invoke(body):
+    return video_handler.lambda_handler({'body': json.dumps(body)}, None)
+
+
+@pytest.mark.parametrize("merge_clips", ["false", "true", 0, 1, None, [], {}])
+def test_merge_clips_must_be_a_boolean(merge_clips):
+    response = _invoke({'youtube_url': 'https://youtu.be/dQw4w9WgXcQ', 'merge_clips': merge_clips})
+
+    assert response['statusCode'] == 400
+    assert json.loads(response['body'])['message'] == 'merge_clips must be a boolean'
+
+
+@pytest.mark.parametrize("merge_clips", [True, False])
+def test_merge_clips_accepts_booleans(merge_clips):
+    response = _invoke({'youtube_url': 'https://youtu.be/dQw4w9WgXcQ', 'merge_clips': merge_clips})
+
+    assert response['statusCode'] == 200
+    clips = json.loads(response['body'])['topic_analysis']['suggested_clips']
+    assert all(('mentions_merged' in clip) == merge_clips for clip in clips)
@@ -0,0 +1,49 @@
+"""
+Tests for YouTube URL parsing.
+"""
+import pytest
+
+from services.youtube_service import YouTubeService
+
+VIDEO_ID = "dQw4w9WgXcQ"
+
+
+@pytest.fixture
+def service():
+    return YouTubeService(api_key=None)
+
+
+@pytest.mark.parametrize("url", [
+    f"https://www.youtube.com/watch?v={VIDEO_ID}",
+    f"https://youtube.com/watch?feature=share&v={VIDEO_ID}&t=42",
+    f"https://m.youtube.com/watch?v={VIDEO_ID}",
+    f"https://youtu.be/{VIDEO_ID}",
+    f"youtu.be/{VIDEO_ID}?t=10",
+    f"https://www.youtube.com/embed/{VIDEO_ID}",
+    f"https://www.youtube.com/shorts/{VIDEO_ID}",
+    f"https://www.youtube.com/v/{VIDEO_ID}",
+    f"https://www.youtube-nocookie.com/embed/{VIDEO_ID}",
+    f"HTTPS://WWW.YOUTUBE.COM/watch?v={VIDEO_ID}",
+    VIDEO_ID,
+    f"  https://youtu.be/{VIDEO_ID}\n",
+])
+def test_extract_video_id_accepts_supported_forms(service, url):
+    assert service.extract_video_id(url) == VIDEO_ID
+
+
+@pytest.mark.parametrize("url", [
+    f"https://evil.com/?v={VIDEO_ID}",
+    f"https://evil.com/watch?v={VIDEO_ID}",
+    f"https://www.youtube.com/watch?vv={VIDEO_ID}",
+    f"https://www.youtube.com/watch?nav={VIDEO_ID}",
+    f"https://notyoutube.com/watch?v={VIDEO_ID}",
+    f"https://youtube.com.evil.com/watch?v={VIDEO_ID}",
+    f"https://evil.com/https://youtu.be/{VIDEO_ID}",
+    f"https://youtu.be/{VIDEO_ID}x",
+    f"{VIDEO_ID}x",
+    "ｄＱｗ４ｗ９ＷｇＸｃＱ",
+    "",
+])
+def test_extract_video_id_rejects_other_input(service, url):
+    with pytest.raises(ValueError):
+        service.extract_video_id(url)